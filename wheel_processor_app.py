@@ -7,19 +7,43 @@ with 3D preview and Blender integration.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-import json
 import os
+import gzip
 import webbrowser
-import tempfile
-import shutil
 from pathlib import Path
 import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import http.server
 import socketserver
 from urllib.parse import quote
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json as _json
+
+def _dumps(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return _json.dumps(obj, indent=2).encode('utf-8')
+    return _json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _loads(buf):
+    """Parse JSON from bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return _json.loads(buf)
+
 class WheelSpec:
     """Wheel specification data class"""
+    __slots__ = ('name', 'diameter', 'width', 'offset', 'bolt_pattern',
+                 'center_bore', 'load_rating', 'model_path', 'preview_image',
+                 '_cached_dict')
+
     def __init__(self, name="", diameter=17, width=7.5, offset=35, 
                  bolt_pattern="5x114.3", center_bore=64.1, load_rating=1500):
         self.name = name
@@ -31,29 +55,49 @@ class WheelSpec:
         self.load_rating = load_rating    # lbs
         self.model_path = ""
         self.preview_image = ""
+        self._cached_dict = None
+        
+    def __setattr__(self, name, value):
+        # Any field change invalidates the cached to_dict() result
+        object.__setattr__(self, name, value)
+        if name != '_cached_dict':
+            object.__setattr__(self, '_cached_dict', None)
         
     def to_dict(self):
-        return {
-            'name': self.name,
-            'diameter': self.diameter,
-            'width': self.width,
-            'offset': self.offset,
-            'bolt_pattern': self.bolt_pattern,
-            'center_bore': self.center_bore,
-            'load_rating': self.load_rating,
-            'model_path': self.model_path,
-            'preview_image': self.preview_image
-        }
+        if self._cached_dict is None:
+            self._cached_dict = {
+                'name': self.name,
+                'diameter': self.diameter,
+                'width': self.width,
+                'offset': self.offset,
+                'bolt_pattern': self.bolt_pattern,
+                'center_bore': self.center_bore,
+                'load_rating': self.load_rating,
+                'model_path': self.model_path,
+                'preview_image': self.preview_image
+            }
+        return self._cached_dict
     
     @classmethod
     def from_dict(cls, data):
         wheel = cls()
         for key, value in data.items():
-            setattr(wheel, key, value)
+            # Private slots such as _cached_dict are never loaded from data
+            if key in cls.__slots__ and not key.startswith('_'):
+                setattr(wheel, key, value)
         return wheel
 
+@lru_cache(maxsize=512)
+def _tire_geometry(width, aspect_ratio, diameter):
+    """Return (sidewall_height, overall_diameter) in mm for a tire size"""
+    sidewall_height = (width * aspect_ratio / 100)
+    return sidewall_height, (diameter * 25.4) + (2 * sidewall_height)
+
 class TireSpec:
     """Tire specification data class"""
+    __slots__ = ('width', 'aspect_ratio', 'diameter', 'load_index', 'speed_rating',
+                 '_sidewall_height', '_overall_diameter', '_cached_dict')
+
     def __init__(self, width=225, aspect_ratio=45, diameter=17, 
                  load_index=91, speed_rating="Y"):
         self.width = width
@@ -62,15 +106,65 @@ class TireSpec:
         self.load_index = load_index
         self.speed_rating = speed_rating
         
-        self.sidewall_height = (width * aspect_ratio / 100)
-        self.overall_diameter = (diameter * 25.4) + (2 * self.sidewall_height)
+        # Derived values are computed on first access
+        self._sidewall_height = None
+        self._overall_diameter = None
+        self._cached_dict = None
         
+    @classmethod
+    def from_dict_fast(cls, data):
+        """Build a tire from saved data without running __init__ or the setattr hook"""
+        tire = cls.__new__(cls)
+        set_field = object.__setattr__
+        set_field(tire, 'width', data['width'])
+        set_field(tire, 'aspect_ratio', data['aspect_ratio'])
+        set_field(tire, 'diameter', data['diameter'])
+        set_field(tire, 'load_index', data.get('load_index', 91))
+        set_field(tire, 'speed_rating', data.get('speed_rating', 'Y'))
+        set_field(tire, '_sidewall_height', None)
+        set_field(tire, '_overall_diameter', None)
+        set_field(tire, '_cached_dict', None)
+        return tire
+        
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if not name.startswith('_'):
+            # Field changes invalidate the cached to_dict() result and,
+            # for the sizing fields, the derived dimensions
+            object.__setattr__(self, '_cached_dict', None)
+            if name in ('width', 'aspect_ratio', 'diameter'):
+                object.__setattr__(self, '_sidewall_height', None)
+                object.__setattr__(self, '_overall_diameter', None)
+        
+    @property
+    def sidewall_height(self):
+        if self._sidewall_height is None:
+            self.update_calculated_values()
+        return self._sidewall_height
+    
+    @property
+    def overall_diameter(self):
+        if self._overall_diameter is None:
+            self.update_calculated_values()
+        return self._overall_diameter
+        
+    def to_dict(self):
+        if self._cached_dict is None:
+            self._cached_dict = {
+                'width': self.width,
+                'aspect_ratio': self.aspect_ratio,
+                'diameter': self.diameter,
+                'load_index': self.load_index,
+                'speed_rating': self.speed_rating
+            }
+        return self._cached_dict
+    
     def get_size_string(self):
         return f"{self.width}/{self.aspect_ratio}R{self.diameter}"
     
     def update_calculated_values(self):
-        self.sidewall_height = (self.width * self.aspect_ratio / 100)
-        self.overall_diameter = (self.diameter * 25.4) + (2 * self.sidewall_height)
+        self._sidewall_height, self._overall_diameter = _tire_geometry(
+            self.width, self.aspect_ratio, self.diameter)
 
 class WheelDatabase:
     """Database manager for wheels and tires"""
@@ -83,9 +177,7 @@ class WheelDatabase:
         self.wheels[wheel_spec.name] = wheel_spec
         
     def add_tire_combination(self, wheel_name, tire_spec):
-        if wheel_name not in self.tire_combinations:
-            self.tire_combinations[wheel_name] = []
-        self.tire_combinations[wheel_name].append(tire_spec)
+        self.tire_combinations.setdefault(wheel_name, []).append(tire_spec)
         
     def get_wheel_names(self):
         return list(self.wheels.keys())
@@ -99,88 +191,80 @@ class WheelDatabase:
         if name in self.tire_combinations:
             del self.tire_combinations[name]
             
-    def save_database(self):
-        try:
-            data = {
-                'wheels': {name: wheel.to_dict() for name, wheel in self.wheels.items()},
-                'tire_combinations': {
-                    wheel_name: [
-                        {
-                            'width': tire.width,
-                            'aspect_ratio': tire.aspect_ratio,
-                            'diameter': tire.diameter,
-                            'load_index': tire.load_index,
-                            'speed_rating': tire.speed_rating
-                        } for tire in tires
-                    ] for wheel_name, tires in self.tire_combinations.items()
-                }
+    def build_payload(self):
+        """Return a serializable snapshot of the database
+        
+        Cheap to rebuild: each spec caches its own to_dict() until it changes.
+        """
+        return {
+            'wheels': {name: wheel.to_dict() for name, wheel in self.wheels.items()},
+            'tire_combinations': {
+                wheel_name: [tire.to_dict() for tire in tires]
+                for wheel_name, tires in self.tire_combinations.items()
             }
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+        }
+            
+    def save_database(self, payload=None):
+        """Write the database; pass a build_payload() snapshot when saving off-thread"""
+        try:
+            if payload is None:
+                payload = self.build_payload()
+            # Encode fully, write to a temp file and swap it in so a failed
+            # save never leaves a truncated database behind
+            payload = _dumps(payload, indent=True)
+            tmp_file = self.data_file + '.tmp'
+            with open(tmp_file, 'wb', buffering=1 << 20) as f:
+                f.write(payload)
+            os.replace(tmp_file, self.data_file)
             return True
         except Exception as e:
             print(f"Error saving database: {e}")
             return False
             
-    def load_database(self):
+    def read_database(self):
+        """Read and parse the database file without touching in-memory state
+        
+        Returns the parsed dict ({} if there is no file yet), or None on error.
+        """
+        try:
+            if not os.path.exists(self.data_file):
+                return {}
+            with open(self.data_file, 'rb') as f:
+                return _loads(f.read())
+        except Exception as e:
+            print(f"Error loading database: {e}")
+            return None
+            
+    def apply_data(self, data):
+        """Populate the database from a read_database() result"""
         try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
+            for name, wheel_data in data.get('wheels', {}).items():
+                self.wheels[name] = WheelSpec.from_dict(wheel_data)
                 
-                for name, wheel_data in data.get('wheels', {}).items():
-                    self.wheels[name] = WheelSpec.from_dict(wheel_data)
-                    
-                for wheel_name, tire_list in data.get('tire_combinations', {}).items():
-                    self.tire_combinations[wheel_name] = []
-                    for tire_data in tire_list:
-                        tire = TireSpec(**tire_data)
-                        self.tire_combinations[wheel_name].append(tire)
+            for wheel_name, tire_list in data.get('tire_combinations', {}).items():
+                self.tire_combinations[wheel_name] = [TireSpec.from_dict_fast(tire_data) for tire_data in tire_list]
             return True
         except Exception as e:
             print(f"Error loading database: {e}")
             return False
             
+    def load_database(self):
+        data = self.read_database()
+        return data is not None and self.apply_data(data)
+            
     def export_for_blender(self, filename):
         """Export database in Blender-compatible format"""
         try:
-            blender_data = {
-                'wheels': {},
-                'tire_combinations': {}
-            }
-            
-            for name, wheel in self.wheels.items():
-                blender_data['wheels'][name] = wheel.to_dict()
-                
-            for wheel_name, tires in self.tire_combinations.items():
-                blender_data['tire_combinations'][wheel_name] = [
-                    {
-                        'width': tire.width,
-                        'aspect_ratio': tire.aspect_ratio,
-                        'diameter': tire.diameter,
-                        'load_index': tire.load_index,
-                        'speed_rating': tire.speed_rating
-                    } for tire in tires
-                ]
-            
-            with open(filename, 'w') as f:
-                json.dump(blender_data, f, indent=2)
+            # Compact JSON: this file is only read by the Blender addon
+            payload = _dumps(self.build_payload())
+            with open(filename, 'wb') as f:
+                f.write(payload)
             return True
         except Exception as e:
             print(f"Error exporting for Blender: {e}")
             return False
 
-class Simple3DViewer:
-    """Simple 3D viewer using web technologies"""
-    def __init__(self):
-        self.server_port = 8000
-        self.server_thread = None
-        self.temp_dir = tempfile.mkdtemp()
-        self.setup_viewer_files()
-        
-    def setup_viewer_files(self):
-        """Create HTML/JS files for 3D viewer"""
-        html_content = '''
+_VIEWER_HTML = '''
 <!DOCTYPE html>
 <html>
 <head>
@@ -411,36 +495,77 @@ class Simple3DViewer:
     </script>
 </body>
 </html>
-        '''
+'''
+
+class _ViewerHandler(http.server.BaseHTTPRequestHandler):
+    """Serves the viewer page from memory"""
+    BODY = _VIEWER_HTML.encode('utf-8')
+    GZ = gzip.compress(BODY)
+    
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/', '/viewer.html'):
+            self.send_error(404)
+            return
         
-        with open(os.path.join(self.temp_dir, 'viewer.html'), 'w') as f:
-            f.write(html_content)
+        use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        body = self.GZ if use_gzip else self.BODY
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        self.wfile.write(body)
+
+class _ViewerServer(socketserver.ThreadingTCPServer):
+    """Threaded TCP server that can rebind the viewer port right after a restart"""
+    allow_reuse_address = True
+    daemon_threads = True
+
+class Simple3DViewer:
+    """Simple 3D viewer using web technologies"""
+    def __init__(self):
+        self.server_port = 8000
+        self.server_thread = None
+        self._httpd = None
     
     def start_server(self):
         """Start local web server for 3D viewer"""
         if self.server_thread and self.server_thread.is_alive():
-            return
+            return True
             
-        def serve():
-            os.chdir(self.temp_dir)
-            handler = http.server.SimpleHTTPRequestHandler
-            with socketserver.TCPServer(("", self.server_port), handler) as httpd:
-                httpd.serve_forever()
-        
-        self.server_thread = threading.Thread(target=serve, daemon=True)
+        try:
+            self._httpd = _ViewerServer(("", self.server_port), _ViewerHandler)
+        except OSError as e:
+            self._httpd = None
+            messagebox.showerror("Error", f"Failed to start 3D viewer server on port {self.server_port}: {e}")
+            return False
+        self.server_thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
         self.server_thread.start()
+        return True
     
     def open_viewer(self):
         """Open 3D viewer in browser"""
-        self.start_server()
+        if not self.start_server():
+            return
         webbrowser.open(f'http://localhost:{self.server_port}/viewer.html')
     
     def cleanup(self):
-        """Clean up temporary files"""
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        """Clean up viewer resources"""
+        # The page is served from memory, so only the server needs stopping
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
 
 class WheelProcessorApp:
     """Main application class"""
+    _size_fmt = "Tire Size: {}/{}R{}"
+    _sidewall_fmt = "Sidewall Height: {:.1f} mm"
+    _diameter_fmt = "Overall Diameter: {:.1f} mm"
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Wheel & Tire Processor")
@@ -451,11 +576,23 @@ class WheelProcessorApp:
         
         self.viewer = Simple3DViewer()
         self.current_wheel = None
+        self._last_names_tuple = None
+        self._tire_update_pending = False
+        self._preview_tire = TireSpec()
+        self._last_tire_strs = [''] * 6
+        self._diameter_after_id = None
+        # Single worker so saves and loads never overlap
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
         
         self.setup_ui()
         
     def setup_ui(self):
         """Create the user interface"""
+        # Status bar for non-blocking success messages
+        self.statusbar_var = tk.StringVar()
+        ttk.Label(self.root, textvariable=self.statusbar_var, anchor=tk.W,
+                  relief=tk.SUNKEN).pack(side=tk.BOTTOM, fill=tk.X)
+        
         # Create notebook for tabs
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
@@ -581,9 +718,14 @@ class WheelProcessorApp:
         self.tire_diameter_label.grid(row=2, column=2, padx=5, pady=5)
         
         # Configure scale callbacks
-        width_scale.configure(command=lambda v: self.update_tire_calc())
-        aspect_scale.configure(command=lambda v: self.update_tire_calc())
-        diameter_scale.configure(command=lambda v: self.update_tire_calc())
+        # Slider values are tracked as plain attributes so the drag path
+        # doesn't read the Tk variables back on every tick
+        self._calc_width = self.tire_width_var.get()
+        self._calc_aspect = self.tire_aspect_var.get()
+        self._calc_diameter = self.tire_diameter_var.get()
+        width_scale.configure(command=self._on_width)
+        aspect_scale.configure(command=self._on_aspect)
+        diameter_scale.configure(command=self._on_diameter)
         
         calc_frame.columnconfigure(1, weight=1)
         
@@ -612,8 +754,10 @@ class WheelProcessorApp:
         export_frame.pack(fill=tk.X, padx=10, pady=10)
         
         ttk.Button(export_frame, text="Export for Blender", command=self.export_for_blender).pack(pady=5)
-        ttk.Button(export_frame, text="Save Database", command=self.save_database).pack(pady=5)
-        ttk.Button(export_frame, text="Load Database", command=self.load_database).pack(pady=5)
+        self.save_db_button = ttk.Button(export_frame, text="Save Database", command=self.save_database)
+        self.save_db_button.pack(pady=5)
+        self.load_db_button = ttk.Button(export_frame, text="Load Database", command=self.load_database)
+        self.load_db_button.pack(pady=5)
         
         # Instructions
         instructions_frame = ttk.LabelFrame(self.export_frame, text="Blender Integration")
@@ -687,7 +831,7 @@ Features available in Blender:
         
         self.database.add_wheel(wheel)
         self.refresh_wheel_list()
-        messagebox.showinfo("Success", f"Wheel '{wheel.name}' saved successfully")
+        return self.set_status(f"Wheel '{wheel.name}' saved successfully")
         
     def remove_wheel(self):
         """Remove selected wheel"""
@@ -720,27 +864,95 @@ Features available in Blender:
             
     def refresh_wheel_list(self):
         """Refresh wheel listbox"""
-        self.wheel_listbox.delete(0, tk.END)
-        for wheel_name in self.database.get_wheel_names():
-            self.wheel_listbox.insert(tk.END, wheel_name)
+        names = tuple(self.database.get_wheel_names())
+        last = self._last_names_tuple or ()
+        if names == last:
+            return
+        
+        # Adding or removing a single wheel only touches that row, so large
+        # inventories aren't re-marshalled to Tk on every change
+        removed = self._removed_index(last, names) if len(names) == len(last) - 1 else None
+        if names[:len(last)] == last:
+            self.wheel_listbox.insert(tk.END, *names[len(last):])
+        elif removed is not None:
+            self.wheel_listbox.delete(removed)
+        else:
+            self.wheel_listbox.delete(0, tk.END)
+            if names:
+                # One Tcl call for all items instead of one per wheel
+                self.wheel_listbox.insert(tk.END, *names)
+        self._last_names_tuple = names
+        
+    @staticmethod
+    def _removed_index(old, new):
+        """Return the index of the single item removed from old to get new, or None"""
+        for i, name in enumerate(new):
+            if name != old[i]:
+                return i if new[i:] == old[i + 1:] else None
+        return len(new)
             
+    def _on_width(self, value):
+        self._calc_width = int(float(value))
+        self._schedule_tire_update()
+        
+    def _on_aspect(self, value):
+        self._calc_aspect = int(float(value))
+        self._schedule_tire_update()
+        
+    def _on_diameter(self, value):
+        self._calc_diameter = int(float(value))
+        self._schedule_tire_update()
+        
+    def _schedule_tire_update(self):
+        """Coalesce slider events into one tire update per idle cycle"""
+        if not self._tire_update_pending:
+            self._tire_update_pending = True
+            self.root.after_idle(self._do_tire_update)
+            
+    def _do_tire_update(self):
+        self._tire_update_pending = False
+        self.update_tire_calc()
+        
     def update_tire_calc(self):
         """Update tire calculations"""
-        width = self.tire_width_var.get()
-        aspect = self.tire_aspect_var.get()
-        diameter = self.tire_diameter_var.get()
-        
-        # Update labels
-        self.tire_width_label.config(text=str(width))
-        self.tire_aspect_label.config(text=str(aspect))
-        self.tire_diameter_label.config(text=str(diameter))
-        
-        # Calculate values
-        tire = TireSpec(width, aspect, diameter)
-        
-        self.tire_size_label.config(text=f"Tire Size: {tire.get_size_string()}")
-        self.sidewall_label.config(text=f"Sidewall Height: {tire.sidewall_height:.1f} mm")
-        self.overall_diameter_label.config(text=f"Overall Diameter: {tire.overall_diameter:.1f} mm")
+        width = self._calc_width
+        aspect = self._calc_aspect
+        diameter = self._calc_diameter
+        
+        # Slider readouts follow the drag directly
+        self._set_tire_labels(0, (self.tire_width_label, self.tire_aspect_label, self.tire_diameter_label),
+                              (str(width), str(aspect), str(diameter)))
+        
+        # The calculated values only need to settle once the user pauses
+        if self._diameter_after_id:
+            self.root.after_cancel(self._diameter_after_id)
+        self._diameter_after_id = self.root.after(100, self._refresh_diameter_label)
+        
+    def _refresh_diameter_label(self):
+        """Recalculate the preview tire and update the result labels"""
+        self._diameter_after_id = None
+        width = self._calc_width
+        aspect = self._calc_aspect
+        diameter = self._calc_diameter
+        
+        # Calculate values on the shared preview tire
+        tire = self._preview_tire
+        tire.width = width
+        tire.aspect_ratio = aspect
+        tire.diameter = diameter
+        tire.update_calculated_values()
+        
+        self._set_tire_labels(3, (self.tire_size_label, self.sidewall_label, self.overall_diameter_label),
+                              (self._size_fmt.format(width, aspect, diameter),
+                               self._sidewall_fmt.format(tire.sidewall_height),
+                               self._diameter_fmt.format(tire.overall_diameter)))
+        
+    def _set_tire_labels(self, first, labels, texts):
+        """Only push labels whose text actually changed through to Tk"""
+        for i, (label, text) in enumerate(zip(labels, texts), first):
+            if text != self._last_tire_strs[i]:
+                label.config(text=text)
+                self._last_tire_strs[i] = text
         
     def add_tire_to_wheel(self):
         """Add current tire specification to selected wheel"""
@@ -755,26 +967,55 @@ Features available in Blender:
         )
         
         self.database.add_tire_combination(self.current_wheel.name, tire)
-        messagebox.showinfo("Success", f"Tire {tire.get_size_string()} added to {self.current_wheel.name}")
+        return self.set_status(f"Tire {tire.get_size_string()} added to {self.current_wheel.name}")
+        
+    def set_status(self, message):
+        """Show a message in the status bar and return it"""
+        self.statusbar_var.set(message)
+        return message
         
     def open_3d_viewer(self):
         """Open 3D viewer"""
         self.viewer.open_viewer()
         
+    def _run_database_io(self, func, on_done):
+        """Run a database operation on the I/O worker, then call on_done(result) on the Tk thread"""
+        self.save_db_button.config(state=tk.DISABLED)
+        self.load_db_button.config(state=tk.DISABLED)
+        self._poll_database_io(self._io_pool.submit(func), on_done)
+        
+    def _poll_database_io(self, future, on_done):
+        # Poll from the Tk thread so no Tk calls are made from the worker
+        if not future.done():
+            self.root.after(50, self._poll_database_io, future, on_done)
+            return
+        self.save_db_button.config(state=tk.NORMAL)
+        self.load_db_button.config(state=tk.NORMAL)
+        on_done(future.result())
+        
     def save_database(self):
         """Save database"""
-        if self.database.save_database():
-            messagebox.showinfo("Success", "Database saved successfully")
-        else:
-            messagebox.showerror("Error", "Failed to save database")
+        def done(ok):
+            if ok:
+                self.set_status("Database saved successfully")
+            else:
+                messagebox.showerror("Error", "Failed to save database")
+        
+        # Snapshot on the Tk thread; the worker only encodes and writes
+        payload = self.database.build_payload()
+        self._run_database_io(lambda: self.database.save_database(payload), done)
             
     def load_database(self):
         """Load database"""
-        if self.database.load_database():
-            self.refresh_wheel_list()
-            messagebox.showinfo("Success", "Database loaded successfully")
-        else:
-            messagebox.showerror("Error", "Failed to load database")
+        def done(data):
+            # Parsed on the worker, applied here on the Tk thread
+            if data is not None and self.database.apply_data(data):
+                self.refresh_wheel_list()
+                self.set_status("Database loaded successfully")
+            else:
+                messagebox.showerror("Error", "Failed to load database")
+        
+        self._run_database_io(self.database.read_database, done)
             
     def export_for_blender(self):
         """Export database for Blender"""
@@ -786,7 +1027,7 @@ Features available in Blender:
         
         if filename:
             if self.database.export_for_blender(filename):
-                messagebox.showinfo("Success", f"Database exported to {filename}")
+                return self.set_status(f"Database exported to {filename}")
             else:
                 messagebox.showerror("Error", "Failed to export database")
                 
@@ -797,6 +1038,8 @@ Features available in Blender:
         
     def on_closing(self):
         """Handle application closing"""
+        # Let a pending save finish before exiting
+        self._io_pool.shutdown(wait=True)
         self.viewer.cleanup()
         self.root.destroy()
 
@@ -1,17 +1,43 @@
 import bpy
-import bmesh
-import json
 import os
-from mathutils import Vector, Matrix
+import sys
+import math
+import sqlite3
+from functools import lru_cache
+import numpy as np
+from mathutils import Matrix
 from bpy.props import StringProperty, FloatProperty, IntProperty, EnumProperty, BoolProperty
 from bpy.types import Panel, Operator, PropertyGroup
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json as _json
+
+def _dumps(obj, indent=False):
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return _json.dumps(obj, indent=2).encode('utf-8')
+    return _json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def _loads(buf):
+    """Parse JSON from bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return _json.loads(buf)
+
 # ==========================================
 # WHEEL AND TIRE DATA CLASSES
 # ==========================================
 
 class WheelSpec:
     """Stores wheel specifications"""
+    __slots__ = ('name', 'diameter', 'width', 'offset', 'bolt_pattern',
+                 'center_bore', 'load_rating', 'model_path')
+
     def __init__(self, name="", diameter=17, width=7.5, offset=35, 
                  bolt_pattern="5x114.3", center_bore=64.1, load_rating=1500):
         self.name = name
@@ -39,11 +65,14 @@ class WheelSpec:
     def from_dict(cls, data):
         wheel = cls()
         for key, value in data.items():
-            setattr(wheel, key, value)
+            if key in cls.__slots__:
+                setattr(wheel, key, value)
         return wheel
 
 class TireSpec:
     """Stores tire specifications"""
+    __slots__ = ('width', 'aspect_ratio', 'diameter', 'load_index', 'speed_rating')
+
     def __init__(self, width=225, aspect_ratio=45, diameter=17, 
                  load_index=91, speed_rating="Y"):
         self.width = width              # mm
@@ -52,88 +81,203 @@ class TireSpec:
         self.load_index = load_index    # tire load capacity code
         self.speed_rating = speed_rating # maximum speed rating
         
-        # Calculated properties
-        self.sidewall_height = (width * aspect_ratio / 100)  # mm
-        self.overall_diameter = (diameter * 25.4) + (2 * self.sidewall_height)  # mm
+    # Calculated properties, always in sync with the current specs
+    @property
+    def sidewall_height(self):
+        """Sidewall height in mm"""
+        return self.width * self.aspect_ratio / 100
+    
+    @property
+    def overall_diameter(self):
+        """Overall tire diameter in mm"""
+        return (self.diameter * 25.4) + (2 * self.sidewall_height)
         
     def get_tire_size_string(self):
         """Returns standard tire size format: 225/45R17"""
         return f"{self.width}/{self.aspect_ratio}R{self.diameter}"
-    
-    def update_calculated_values(self):
-        """Recalculate derived values when specs change"""
-        self.sidewall_height = (self.width * self.aspect_ratio / 100)
-        self.overall_diameter = (self.diameter * 25.4) + (2 * self.sidewall_height)
 
 # ==========================================
 # WHEEL DATABASE MANAGER
 # ==========================================
 
+_WHEEL_COLUMNS = ('name', 'diameter', 'width', 'offset', 'bolt_pattern',
+                  'center_bore', 'load_rating', 'model_path')
+_TIRE_COLUMNS = ('width', 'aspect_ratio', 'diameter', 'load_index', 'speed_rating')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS wheels (
+    name TEXT PRIMARY KEY,
+    diameter NUMERIC,
+    width NUMERIC,
+    offset NUMERIC,
+    bolt_pattern TEXT,
+    center_bore NUMERIC,
+    load_rating NUMERIC,
+    model_path TEXT
+);
+CREATE TABLE IF NOT EXISTS tires (
+    wheel_name TEXT,
+    width INTEGER,
+    aspect_ratio INTEGER,
+    diameter INTEGER,
+    load_index INTEGER,
+    speed_rating TEXT,
+    FOREIGN KEY (wheel_name) REFERENCES wheels(name)
+);
+CREATE INDEX IF NOT EXISTS idx_tires_wheel ON tires(wheel_name);
+"""
+
 class WheelDatabase:
-    """Manages wheel and tire combinations"""
+    """Manages wheel and tire combinations
+    
+    Wheels and tires are stored in SQLite so single additions don't rewrite
+    the whole database. The JSON file is kept as the import/export format.
+    """
     def __init__(self):
-        self.wheels = {}
+        scripts_dir = bpy.utils.user_resource('SCRIPTS', create=True)
+        self.data_file = os.path.join(scripts_dir, "wheel_database.json")
+        self.db_file = os.path.join(scripts_dir, "wheel_database.sqlite")
+        self.conn = None
+        # TireSpecs per wheel, materialized from SQLite on first access
         self.tire_combinations = {}
-        self.data_file = os.path.join(bpy.utils.user_resource('SCRIPTS'), "wheel_database.json")
+        
+    def connect(self):
+        """Open the SQLite database, creating the schema on first use
+        
+        Called lazily by every database method, so sessions that never touch
+        the wheel database don't pay for opening (or migrating) it. Returns
+        True if this call just imported the JSON file into a new database.
+        """
+        if self.conn is not None:
+            return False
+        self.conn = sqlite3.connect(self.db_file)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+        
+        # user_version is 0 only for a freshly created database: migrate the
+        # previous JSON storage once. The JSON file is left in place as a backup,
+        # and a failed import is retried on the next connect.
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+            if self.load_database():
+                self.conn.execute("PRAGMA user_version = 1")
+                return True
+        return False
+            
+    def close(self):
+        """Close the SQLite connection"""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        self.tire_combinations.clear()
+        
+    @staticmethod
+    def _wheel_row(wheel_spec):
+        data = wheel_spec.to_dict()
+        return tuple(data[column] for column in _WHEEL_COLUMNS)
+    
+    @staticmethod
+    def _tire_row(wheel_name, tire_spec):
+        return (wheel_name, tire_spec.width, tire_spec.aspect_ratio, tire_spec.diameter,
+                tire_spec.load_index, tire_spec.speed_rating)
         
     def add_wheel(self, wheel_spec):
         """Add a wheel to the database"""
-        self.wheels[wheel_spec.name] = wheel_spec
+        self.connect()
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO wheels VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                              self._wheel_row(wheel_spec))
         
     def add_tire_combination(self, wheel_name, tire_spec):
         """Add a tire specification for a wheel"""
-        if wheel_name not in self.tire_combinations:
-            self.tire_combinations[wheel_name] = []
-        self.tire_combinations[wheel_name].append(tire_spec)
+        self.connect()
+        with self.conn:
+            self.conn.execute("INSERT INTO tires VALUES (?, ?, ?, ?, ?, ?)",
+                              self._tire_row(wheel_name, tire_spec))
+        if wheel_name in self.tire_combinations:
+            self.tire_combinations[wheel_name] += (tire_spec,)
         
     def get_compatible_tires(self, wheel_name):
-        """Get all tire combinations for a wheel"""
-        return self.tire_combinations.get(wheel_name, [])
+        """Get all tire combinations for a wheel as an immutable snapshot"""
+        if wheel_name not in self.tire_combinations:
+            self.connect()
+            rows = self.conn.execute(
+                "SELECT width, aspect_ratio, diameter, load_index, speed_rating "
+                "FROM tires WHERE wheel_name = ? ORDER BY rowid", (wheel_name,))
+            # Speed ratings are a handful of letters; share one string each.
+            # Rows added outside the addon may hold NULL or non-text values.
+            self.tire_combinations[wheel_name] = tuple(
+                TireSpec(width, aspect_ratio, diameter, load_index,
+                         sys.intern(speed_rating) if isinstance(speed_rating, str) else speed_rating)
+                for width, aspect_ratio, diameter, load_index, speed_rating in rows)
+        return self.tire_combinations[wheel_name]
         
     def save_database(self):
-        """Save database to file"""
+        """Export the database to the JSON file"""
         try:
+            self.connect()
+            wheels = {
+                row[0]: dict(zip(_WHEEL_COLUMNS, row))
+                for row in self.conn.execute("SELECT * FROM wheels ORDER BY rowid")
+            }
+            tire_combinations = {}
+            for wheel_name, *tire in self.conn.execute("SELECT * FROM tires ORDER BY rowid"):
+                tire_combinations.setdefault(wheel_name, []).append(dict(zip(_TIRE_COLUMNS, tire)))
+            
             data = {
-                'wheels': {name: wheel.to_dict() for name, wheel in self.wheels.items()},
-                'tire_combinations': {
-                    wheel_name: [
-                        {
-                            'width': tire.width,
-                            'aspect_ratio': tire.aspect_ratio,
-                            'diameter': tire.diameter,
-                            'load_index': tire.load_index,
-                            'speed_rating': tire.speed_rating
-                        } for tire in tires
-                    ] for wheel_name, tires in self.tire_combinations.items()
-                }
+                'wheels': wheels,
+                'tire_combinations': tire_combinations
             }
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Write to a temp file and swap it in so a crash mid-save never
+            # leaves a torn database file behind
+            payload = _dumps(data, indent=True)
+            tmp_file = self.data_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            try:
+                os.replace(tmp_file, self.data_file)
+            except OSError:
+                os.remove(tmp_file)
+                raise
             print(f"Database saved to {self.data_file}")
         except Exception as e:
             print(f"Error saving database: {e}")
             
     def load_database(self):
-        """Load database from file"""
+        """Import the JSON file into the database, returning True on success"""
         try:
+            if self.connect():
+                # Opening a new database already imported the JSON file
+                return True
             if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.data_file, 'rb') as f:
+                    data = _loads(f.read())
                 
-                # Load wheels
-                for name, wheel_data in data.get('wheels', {}).items():
-                    self.wheels[name] = WheelSpec.from_dict(wheel_data)
-                    
-                # Load tire combinations
-                for wheel_name, tire_list in data.get('tire_combinations', {}).items():
-                    self.tire_combinations[wheel_name] = []
-                    for tire_data in tire_list:
-                        tire = TireSpec(**tire_data)
-                        self.tire_combinations[wheel_name].append(tire)
+                wheel_rows = [self._wheel_row(WheelSpec.from_dict(wheel_data))
+                              for wheel_data in data.get('wheels', {}).values()]
+                tire_combinations = data.get('tire_combinations', {})
+                tire_rows = [self._tire_row(wheel_name, TireSpec(**tire_data))
+                             for wheel_name, tire_list in tire_combinations.items()
+                             for tire_data in tire_list]
+                
+                # Single transaction with batched statements
+                with self.conn:
+                    self.conn.executemany("INSERT OR REPLACE INTO wheels VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                                          wheel_rows)
+                    # Imported tire lists replace any stored for the same wheel
+                    self.conn.executemany("DELETE FROM tires WHERE wheel_name = ?",
+                                          [(wheel_name,) for wheel_name in tire_combinations])
+                    self.conn.executemany("INSERT INTO tires VALUES (?, ?, ?, ?, ?, ?)", tire_rows)
+                for wheel_name in tire_combinations:
+                    self.tire_combinations.pop(wheel_name, None)
                         
             print("Database loaded successfully")
+            return True
         except Exception as e:
             print(f"Error loading database: {e}")
+            return False
 
 # Global database instance
 wheel_db = WheelDatabase()
@@ -142,8 +286,43 @@ wheel_db = WheelDatabase()
 # TIRE GENERATION FUNCTIONS
 # ==========================================
 
+# Names of generated tire meshes keyed by size and wheel diameter; objects
+# of the same size share one mesh datablock. Only names are kept because
+# Mesh references go stale after undo or loading a file
+_tire_mesh_cache = {}
+
+@lru_cache(maxsize=8)
+def _spin_trig(segments):
+    """Return read-only (cos, sin) arrays for a full revolution in segments steps"""
+    angles = np.linspace(0, 2 * np.pi, segments, endpoint=False)
+    cos, sin = np.cos(angles), np.sin(angles)
+    cos.flags.writeable = False
+    sin.flags.writeable = False
+    return cos, sin
+
 def create_parametric_tire(tire_spec, wheel_diameter_mm):
-    """Create a procedural tire mesh based on specifications"""
+    """Create a procedural tire object based on specifications"""
+    key = f"{tire_spec.get_tire_size_string()}_{wheel_diameter_mm}"
+    mesh = bpy.data.meshes.get(_tire_mesh_cache.get(key, ""))
+    if mesh is not None and mesh.get("tire_cache_key") != key:
+        # Name now belongs to some other mesh (removed, renamed or new file)
+        mesh = None
+    
+    if mesh is None:
+        mesh = build_tire_mesh(tire_spec, wheel_diameter_mm)
+        mesh["tire_cache_key"] = key
+        _tire_mesh_cache[key] = mesh.name
+    
+    obj = bpy.data.objects.new(f"Tire_{tire_spec.get_tire_size_string()}", mesh)
+    bpy.context.collection.objects.link(obj)
+    
+    # Add material for tire
+    create_tire_material(obj)
+    
+    return obj
+
+def build_tire_mesh(tire_spec, wheel_diameter_mm):
+    """Generate the procedural tire mesh for a tire size"""
     
     # Convert tire specs to metric
     tire_width_m = tire_spec.width / 1000
@@ -151,77 +330,64 @@ def create_parametric_tire(tire_spec, wheel_diameter_mm):
     wheel_radius_m = wheel_diameter_mm / 2000
     tire_outer_radius_m = wheel_radius_m + sidewall_height_m
     
-    # Create new mesh
-    mesh = bpy.data.meshes.new(f"Tire_{tire_spec.get_tire_size_string()}")
-    obj = bpy.data.objects.new(mesh.name, mesh)
-    bpy.context.collection.objects.link(obj)
-    
-    # Generate tire geometry using bmesh
-    bm = bmesh.new()
-    
-    # Create tire profile using spin
-    profile_verts = []
     segments = 32
     
-    # Create tire cross-section profile
+    # Create tire cross-section profile as (radius, axial offset) rows
     # Outer sidewall
-    profile_verts.append((wheel_radius_m, -tire_width_m/2, 0))
-    profile_verts.append((tire_outer_radius_m * 0.95, -tire_width_m/2, 0))
-    profile_verts.append((tire_outer_radius_m, -tire_width_m/2 * 0.8, 0))
+    sidewall = np.array([
+        (wheel_radius_m, -tire_width_m/2),
+        (tire_outer_radius_m * 0.95, -tire_width_m/2),
+        (tire_outer_radius_m, -tire_width_m/2 * 0.8),
+    ])
     
     # Tread area
-    for i in range(5):
-        angle = (i / 4) * 0.2 - 0.1
-        x = tire_outer_radius_m + 0.01 * (1 - abs(angle * 10))  # Slight tread bulge
-        y = -tire_width_m/2 * 0.8 + (i / 4) * tire_width_m * 0.6
-        profile_verts.append((x, y, 0))
+    tread_angles = np.linspace(-0.1, 0.1, 5)
+    tread = np.column_stack((
+        tire_outer_radius_m + 0.01 * (1 - np.abs(tread_angles * 10)),  # Slight tread bulge
+        -tire_width_m/2 * 0.8 + np.linspace(0, 1, 5) * tire_width_m * 0.6,
+    ))
     
     # Other sidewall (mirror)
-    for i in range(len(profile_verts) - 1, -1, -1):
-        x, y, z = profile_verts[i]
-        profile_verts.append((x, -y, z))
-    
-    # Create vertices in bmesh
-    bm_verts = []
-    for vert in profile_verts:
-        bm_verts.append(bm.verts.new(vert))
-    
-    # Create edges for profile
-    for i in range(len(bm_verts) - 1):
-        bm.edges.new([bm_verts[i], bm_verts[i + 1]])
-    
-    # Spin the profile to create tire
-    spin_axis = (0, 0, 1)
-    spin_center = (0, 0, 0)
-    
-    bmesh.ops.spin(bm, 
-                   geom=bm.edges[:] + bm.verts[:],
-                   cent=spin_center,
-                   axis=spin_axis,
-                   angle=6.28318,  # 2π radians
-                   steps=segments)
-    
-    # Remove duplicate vertices
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.001)
-    
-    # Calculate normals and update mesh
-    bm.normal_update()
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    # Add material for tire
-    create_tire_material(obj)
+    front = np.vstack((sidewall, tread))
+    mirror = front[::-1].copy()
+    mirror[:, 1] *= -1
+    profile = np.vstack((front, mirror))
+    
+    # Merge coincident neighbours (where the sidewall meets the tread)
+    keep = np.ones(len(profile), dtype=bool)
+    keep[1:] = np.linalg.norm(np.diff(profile, axis=0), axis=1) > 0.001
+    profile = profile[keep]
+    
+    # Revolve the profile around the Z axis: one ring of vertices per profile point
+    cos, sin = _spin_trig(segments)
+    radius = profile[:, 0:1]
+    verts = np.empty((len(profile), segments, 3))
+    verts[..., 0] = radius * cos
+    verts[..., 1] = radius * sin
+    verts[..., 2] = profile[:, 1:2]
+    
+    # Quad faces between neighbouring rings, wrapping around the seam
+    ring = np.arange(segments)
+    ring_start = np.arange(len(profile) - 1)[:, None] * segments
+    current = ring_start + ring
+    following = ring_start + (ring + 1) % segments
+    faces = np.stack([current, following, following + segments, current + segments], axis=-1)
+    
+    # Build the mesh in a single call
+    mesh = bpy.data.meshes.new(f"Tire_{tire_spec.get_tire_size_string()}")
+    mesh.from_pydata(verts.reshape(-1, 3).tolist(), [], faces.reshape(-1, 4).tolist())
+    mesh.validate()
+    mesh.update()
     
-    return obj
+    return mesh
 
 def create_tire_material(tire_obj):
     """Create a realistic tire material"""
     mat_name = "TireMaterial"
     
     # Check if material already exists
-    if mat_name in bpy.data.materials:
-        mat = bpy.data.materials[mat_name]
-    else:
+    mat = bpy.data.materials.get(mat_name)
+    if mat is None:
         mat = bpy.data.materials.new(name=mat_name)
         mat.use_nodes = True
         nodes = mat.node_tree.nodes
@@ -256,41 +422,43 @@ def create_tire_material(tire_obj):
 # WHEEL IMPORT AND PROCESSING
 # ==========================================
 
+# Importer per file extension; operators are looked up at call time
+_IMPORTERS = {
+    '.obj': lambda fp: bpy.ops.import_scene.obj(filepath=fp),
+    '.fbx': lambda fp: bpy.ops.import_scene.fbx(filepath=fp),
+    '.dae': lambda fp: bpy.ops.wm.collada_import(filepath=fp),
+    '.ply': lambda fp: bpy.ops.import_mesh.ply(filepath=fp),
+}
+
 def import_wheel_model(filepath, wheel_spec):
     """Import a wheel 3D model and set up specifications"""
     
-    # Store current selection
-    original_selection = bpy.context.selected_objects[:]
+    # Store current selection by pointer for O(1) membership tests
+    original_selection = {obj.as_pointer() for obj in bpy.context.selected_objects}
     
     # Import based on file type
     file_ext = os.path.splitext(filepath)[1].lower()
+    importer = _IMPORTERS.get(file_ext)
+    if importer is None:
+        print(f"Unsupported file format: {file_ext}")
+        return None
     
     try:
-        if file_ext in ['.obj']:
-            bpy.ops.import_scene.obj(filepath=filepath)
-        elif file_ext in ['.fbx']:
-            bpy.ops.import_scene.fbx(filepath=filepath)
-        elif file_ext in ['.dae']:
-            bpy.ops.wm.collada_import(filepath=filepath)
-        elif file_ext in ['.ply']:
-            bpy.ops.import_mesh.ply(filepath=filepath)
-        else:
-            print(f"Unsupported file format: {file_ext}")
-            return None
-            
+        importer(filepath)
     except Exception as e:
         print(f"Error importing wheel model: {e}")
         return None
     
     # Get newly imported objects
-    new_objects = [obj for obj in bpy.context.selected_objects if obj not in original_selection]
+    new_objects = [obj for obj in bpy.context.selected_objects
+                   if obj.as_pointer() not in original_selection]
     
     if not new_objects:
         print("No objects were imported")
         return None
     
     # Assume the main wheel object is the largest by volume
-    wheel_obj = max(new_objects, key=lambda obj: get_object_volume(obj))
+    wheel_obj = max(new_objects, key=get_object_volume)
     
     # Rename and set up wheel object
     wheel_obj.name = f"Wheel_{wheel_spec.name}"
@@ -309,8 +477,11 @@ def import_wheel_model(filepath, wheel_spec):
     
     if current_diameter > 0:
         scale_factor = target_diameter_m / current_diameter
-        wheel_obj.scale = (scale_factor, scale_factor, scale_factor)
-        bpy.context.view_layer.update()
+        # Bounds ignore the object's scale, so skip the depsgraph update only
+        # when the object is already scaled by exactly this factor
+        if not all(math.isclose(s, scale_factor, rel_tol=1e-4) for s in wheel_obj.scale):
+            wheel_obj.scale = (scale_factor, scale_factor, scale_factor)
+            bpy.context.view_layer.update()
     
     # Add to wheel database
     wheel_spec.model_path = filepath
@@ -332,16 +503,9 @@ def get_object_bounds(obj):
     if obj.type != 'MESH':
         return (0, 0, 0)
     
-    bbox = [Vector(corner) for corner in obj.bound_box]
-    min_coords = Vector((min(bbox, key=lambda v: v.x).x,
-                        min(bbox, key=lambda v: v.y).y,
-                        min(bbox, key=lambda v: v.z).z))
-    max_coords = Vector((max(bbox, key=lambda v: v.x).x,
-                        max(bbox, key=lambda v: v.y).y,
-                        max(bbox, key=lambda v: v.z).z))
-    
-    dimensions = max_coords - min_coords
-    return (dimensions.x, dimensions.y, dimensions.z)
+    # bound_box is already 8 (x, y, z) float triples; no Vector/array needed
+    xs, ys, zs = zip(*obj.bound_box)
+    return (max(xs) - min(xs), max(ys) - min(ys), max(zs) - min(zs))
 
 # ==========================================
 # BLENDER OPERATORS
@@ -525,15 +689,14 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     
-    # Load database on startup
-    wheel_db.load_database()
-    
     print("Wheel & Tire System registered successfully")
 
 def unregister():
     for cls in classes:
         bpy.utils.unregister_class(cls)
     
+    wheel_db.close()
+    
     print("Wheel & Tire System unregistered")
 
 if __name__ == "__main__":